@@ -153,6 +153,37 @@ def search_documents():
         return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
 
 
+@bp.route('/changes', methods=['GET'])
+def get_changes():
+    """
+    Get documents changed since a change token (delta sync)
+
+    GET /api/documents/changes?since=0&limit=100  (limit is capped at 1000)
+    Returns: 200 OK with changed documents, deletion tombstones and next token
+             or 400 Bad Request for an invalid since/limit
+    """
+    try:
+        # Parse raw values: a bad token must not silently fall back to a full resync
+        try:
+            since = int(request.args.get('since', '0'))
+            limit = int(request.args.get('limit', '100'))
+        except ValueError:
+            return jsonify({'error': 'since and limit must be integers'}), 400
+
+        changes = document_service.get_changes(since=since, limit=limit)
+
+        return jsonify({
+            'documents': [doc.to_dict() for doc in changes['documents']],
+            'deleted': [tombstone.to_dict() for tombstone in changes['deleted']],
+            'next_since': changes['next_since'],
+            'has_more': changes['has_more']
+        }), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
+
+
 @bp.route('/<int:document_id>/regenerate-ai', methods=['POST'])
 def regenerate_ai_content(document_id):
     """
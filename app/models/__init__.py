@@ -1,3 +1,4 @@
 from app.models.document import Document
+from app.models.document_tombstone import DocumentTombstone
 
-__all__ = ['Document']
\ No newline at end of file
+__all__ = ['Document', 'DocumentTombstone']
\ No newline at end of file
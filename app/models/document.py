@@ -1,6 +1,10 @@
 from datetime import datetime
 from app import db
 
+# Shared by documents and tombstones so every change gets a unique, monotonic token
+document_change_seq = db.Sequence('document_change_seq')
+
+
 class Document(db.Model):
     """Model representing a document in the knowledge base"""
 
@@ -27,6 +31,11 @@ class Document(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    # Change token for delta sync (bumped on every insert/update)
+    change_seq = db.Column(db.BigInteger, document_change_seq,
+                           onupdate=document_change_seq.next_value(),
+                           server_default=document_change_seq.next_value(), nullable=False, index=True)
+
     def to_dict(self):
         """Convert model to dictionary (for API responses)"""
         return {
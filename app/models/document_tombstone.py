@@ -0,0 +1,32 @@
+from datetime import datetime
+from app import db
+from app.models.document import document_change_seq
+
+
+class DocumentTombstone(db.Model):
+    """Deletion log entry, lets sync clients detect removed documents"""
+
+    __tablename__ = 'document_tombstones'
+
+    # Primary key
+    id = db.Column(db.Integer, primary_key=True)
+
+    # ID of the deleted document (no FK, the row is gone)
+    document_id = db.Column(db.Integer, nullable=False)
+
+    # Change token, shares the sequence with Document.change_seq
+    change_seq = db.Column(db.BigInteger, document_change_seq,
+                           server_default=document_change_seq.next_value(), nullable=False, index=True)
+
+    # Timestamps
+    deleted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def to_dict(self):
+        """Convert model to dictionary (for API responses)"""
+        return {
+            'id': self.document_id,
+            'deleted_at': self.deleted_at.isoformat() if self.deleted_at else None,
+        }
+
+    def __repr__(self):
+        return f'<DocumentTombstone {self.document_id}>'
@@ -1,14 +1,33 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import text
 from app import db
-from app.models import Document
+from app.models import Document, DocumentTombstone
+
+# Advisory lock key guarding change_seq assignment (arbitrary, app-wide)
+CHANGE_LOCK_KEY = 260261
 
 
 class DocumentRepository:
     """Repository for Document database operations"""
 
+    @staticmethod
+    def _lock_changes(shared: bool = False) -> None:
+        """
+        Take the change advisory lock until the end of the transaction
+
+        Writers take it exclusively before change_seq is assigned, so a token
+        only becomes visible together with every token below it. Sync readers
+        take it shared, so they never observe a gap left by an in-flight write.
+        """
+        lock = 'pg_advisory_xact_lock_shared' if shared else 'pg_advisory_xact_lock'
+        # Don't flush pending changes (and draw a token) before holding the lock
+        with db.session.no_autoflush:
+            db.session.execute(text(f'SELECT {lock}(:key)'), {'key': CHANGE_LOCK_KEY})
+
     @staticmethod
     def create(document: Document) -> Document:
         """Create a new document"""
+        DocumentRepository._lock_changes()
         db.session.add(document)
         db.session.commit()
         db.session.refresh(document)
@@ -27,13 +46,16 @@ class DocumentRepository:
     @staticmethod
     def update(document: Document) -> Document:
         """Update existing document"""
+        DocumentRepository._lock_changes()
         db.session.commit()
         db.session.refresh(document)
         return document
 
     @staticmethod
     def delete(document: Document) -> None:
-        """Delete document"""
+        """Delete document and record a tombstone in the same transaction"""
+        DocumentRepository._lock_changes()
+        db.session.add(DocumentTombstone(document_id=document.id))
         db.session.delete(document)
         db.session.commit()
 
@@ -49,4 +71,36 @@ class DocumentRepository:
         """Get documents by tags"""
         return Document.query.filter(
             Document.tags.op('?|')(tags)
-        ).all()
\ No newline at end of file
+        ).all()
+
+    @staticmethod
+    def get_changes_since(since: int, limit: int = 100) -> Tuple[List[Document], List[DocumentTombstone], int]:
+        """
+        Get documents and tombstones with change_seq > since (both ordered by change_seq)
+
+        Also returns the watermark: the last token drawn from the sequence.
+        While the shared lock is held every token up to it is either committed
+        or rolled back, so a client can safely resume from it.
+
+        The read transaction is rolled back before returning, releasing the
+        lock so writers don't wait while the caller serializes the page. The
+        returned rows are detached with their columns already loaded.
+        """
+        DocumentRepository._lock_changes(shared=True)
+        watermark = db.session.execute(text(
+            'SELECT CASE WHEN is_called THEN last_value ELSE 0 END FROM document_change_seq'
+        )).scalar()
+        documents = Document.query.filter(
+            Document.change_seq > since
+        ).order_by(Document.change_seq).limit(limit).all()
+        tombstones = DocumentTombstone.query.filter(
+            DocumentTombstone.change_seq > since
+        ).order_by(DocumentTombstone.change_seq).limit(limit).all()
+
+        # Detach the rows so the rollback doesn't expire them, then end the
+        # transaction to release the shared lock
+        for item in documents + tombstones:
+            db.session.expunge(item)
+        db.session.rollback()
+
+        return documents, tombstones, watermark
\ No newline at end of file
@@ -3,6 +3,9 @@ from app.models import Document
 from app.repositories import DocumentRepository
 from app.services.ai_service import AIService
 
+# Upper bound on changes per sync page
+MAX_CHANGES_LIMIT = 1000
+
 
 class DocumentService:
     """Service layer for document business logic"""
@@ -92,6 +95,58 @@ class DocumentService:
         self.repository.delete(document)
         return True
 
+    def get_changes(self, since: int = 0, limit: int = 100) -> Dict:
+        """
+        Get documents created/updated and deleted after a change token
+
+        Args:
+            since: Change token from a previous call (0 for a full sync)
+            limit: Maximum number of changes (documents + deletions) to return,
+                   capped at MAX_CHANGES_LIMIT
+
+        Returns:
+            {
+                'documents': [Document, ...],
+                'deleted': [DocumentTombstone, ...],
+                'next_since': token to pass on the next call,
+                'has_more': whether more changes are pending
+            }
+        """
+        if since < 0:
+            raise ValueError("since must be a non-negative integer")
+
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+
+        limit = min(limit, MAX_CHANGES_LIMIT)
+
+        # Fetch one extra row to know if there are more changes
+        documents, tombstones, watermark = self.repository.get_changes_since(since, limit=limit + 1)
+
+        # A token from the future (restored database, other environment) would
+        # silently skip every change up to it, so make the client resync
+        if since > watermark:
+            raise ValueError("since is ahead of the latest change token, resync from since=0")
+
+        # Merge both streams by change token and keep the first `limit` changes
+        changes = sorted(documents + tombstones, key=lambda item: item.change_seq)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        # A truncated page resumes after its last change; a complete one can
+        # skip ahead to the watermark (tokens below it are all settled)
+        if has_more:
+            next_since = changes[-1].change_seq
+        else:
+            next_since = watermark
+
+        return {
+            'documents': [item for item in changes if isinstance(item, Document)],
+            'deleted': [item for item in changes if not isinstance(item, Document)],
+            'next_since': next_since,
+            'has_more': has_more
+        }
+
     def search_documents(self, query: str) -> List[Document]:
         """Search documents by title"""
         if not query or len(query.strip()) == 0:
@@ -0,0 +1,37 @@
+"""create documents table
+
+Revision ID: a1c3e5f70b21
+Revises: 
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c3e5f70b21'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('documents',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('summary', sa.Text(), nullable=True),
+    sa.Column('source_type', sa.String(length=50), nullable=False),
+    sa.Column('source_url', sa.String(length=500), nullable=True),
+    sa.Column('file_path', sa.String(length=500), nullable=True),
+    sa.Column('tags', sa.JSON(), nullable=True),
+    sa.Column('embedding', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('documents')
@@ -0,0 +1,46 @@
+"""add change_seq and document_tombstones for delta sync
+
+Revision ID: b7d2f4a9c630
+Revises: a1c3e5f70b21
+Create Date: 2026-10-19 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2f4a9c630'
+down_revision = 'a1c3e5f70b21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Autogenerate does not emit CREATE SEQUENCE
+    op.execute(sa.schema.CreateSequence(sa.Sequence('document_change_seq')))
+
+    # server_default backfills existing rows with a token each
+    op.add_column('documents', sa.Column('change_seq', sa.BigInteger(),
+                                         server_default=sa.text("nextval('document_change_seq')"),
+                                         nullable=True))
+    op.alter_column('documents', 'change_seq', nullable=False)
+    op.create_index(op.f('ix_documents_change_seq'), 'documents', ['change_seq'], unique=False)
+
+    op.create_table('document_tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('document_id', sa.Integer(), nullable=False),
+    sa.Column('change_seq', sa.BigInteger(),
+              server_default=sa.text("nextval('document_change_seq')"), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_document_tombstones_change_seq'), 'document_tombstones', ['change_seq'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_document_tombstones_change_seq'), table_name='document_tombstones')
+    op.drop_table('document_tombstones')
+    op.drop_index(op.f('ix_documents_change_seq'), table_name='documents')
+    op.drop_column('documents', 'change_seq')
+    op.execute(sa.schema.DropSequence(sa.Sequence('document_change_seq')))
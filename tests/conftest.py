@@ -0,0 +1,42 @@
+import os
+
+# Must be set before app.config is imported: the config reads them at import time
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('ANTHROPIC_API_KEY', 'test-key')
+
+import pytest
+from app.models import Document, DocumentTombstone
+from app.services import DocumentService
+
+
+class StubRepository:
+    """In-memory stand-in for DocumentRepository.get_changes_since"""
+
+    def __init__(self, documents, tombstones, watermark):
+        self.documents = documents
+        self.tombstones = tombstones
+        self.watermark = watermark
+        self.requested_limit = None
+
+    def get_changes_since(self, since, limit=100):
+        self.requested_limit = limit
+        documents = sorted((d for d in self.documents if d.change_seq > since),
+                           key=lambda d: d.change_seq)[:limit]
+        tombstones = sorted((t for t in self.tombstones if t.change_seq > since),
+                            key=lambda t: t.change_seq)[:limit]
+        return documents, tombstones, self.watermark
+
+
+@pytest.fixture
+def repository():
+    # Interleaved tokens: documents 1, 4, 5 and tombstones 2, 3, 6
+    documents = [Document(id=seq, title=f'Doc {seq}', change_seq=seq) for seq in (1, 4, 5)]
+    tombstones = [DocumentTombstone(document_id=100 + seq, change_seq=seq) for seq in (2, 3, 6)]
+    return StubRepository(documents, tombstones, watermark=6)
+
+
+@pytest.fixture
+def service(repository):
+    document_service = DocumentService()
+    document_service.repository = repository
+    return document_service
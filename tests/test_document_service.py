@@ -0,0 +1,82 @@
+import pytest
+from app.services.document_service import MAX_CHANGES_LIMIT
+
+
+def seqs(items):
+    return [item.change_seq for item in items]
+
+
+def test_get_changes_merges_documents_and_tombstones(service):
+    changes = service.get_changes(since=0, limit=10)
+
+    assert seqs(changes['documents']) == [1, 4, 5]
+    assert seqs(changes['deleted']) == [2, 3, 6]
+    assert changes['has_more'] is False
+    assert changes['next_since'] == 6
+
+
+def test_get_changes_exactly_limit_has_no_more(service):
+    changes = service.get_changes(since=0, limit=6)
+
+    assert len(changes['documents']) + len(changes['deleted']) == 6
+    assert changes['has_more'] is False
+    assert changes['next_since'] == 6
+
+
+def test_get_changes_limit_plus_one_truncates_in_token_order(service):
+    changes = service.get_changes(since=0, limit=5)
+
+    assert seqs(changes['documents']) == [1, 4, 5]
+    assert seqs(changes['deleted']) == [2, 3]
+    assert changes['has_more'] is True
+    assert changes['next_since'] == 5
+
+
+def test_get_changes_pages_through_everything_once(service):
+    since, seen = 0, []
+
+    while True:
+        changes = service.get_changes(since=since, limit=2)
+        seen += seqs(changes['documents']) + seqs(changes['deleted'])
+        since = changes['next_since']
+        if not changes['has_more']:
+            break
+
+    assert sorted(seen) == [1, 2, 3, 4, 5, 6]
+    assert len(seen) == 6
+    assert since == 6
+
+
+def test_get_changes_with_no_changes_keeps_token(service):
+    changes = service.get_changes(since=6)
+
+    assert changes['documents'] == []
+    assert changes['deleted'] == []
+    assert changes['has_more'] is False
+    assert changes['next_since'] == 6
+
+
+def test_get_changes_with_no_changes_advances_to_watermark(service, repository):
+    # Tokens 7 and 8 were drawn by rolled-back writes
+    repository.watermark = 8
+
+    changes = service.get_changes(since=6)
+
+    assert changes['next_since'] == 8
+
+
+def test_get_changes_rejects_token_from_the_future(service):
+    with pytest.raises(ValueError):
+        service.get_changes(since=99)
+
+
+def test_get_changes_caps_limit(service, repository):
+    service.get_changes(since=0, limit=10 ** 9)
+
+    assert repository.requested_limit == MAX_CHANGES_LIMIT + 1
+
+
+@pytest.mark.parametrize('since, limit', [(-1, 100), (0, 0), (0, -5)])
+def test_get_changes_rejects_invalid_arguments(service, since, limit):
+    with pytest.raises(ValueError):
+        service.get_changes(since=since, limit=limit)
@@ -0,0 +1,52 @@
+import pytest
+from app import create_app
+from app.api.routes import documents
+from app.services.document_service import MAX_CHANGES_LIMIT
+
+
+@pytest.fixture
+def client(service, monkeypatch):
+    monkeypatch.setattr(documents, 'document_service', service)
+    app = create_app('production')
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+def test_changes_returns_documents_and_tombstones(client):
+    response = client.get('/api/documents/changes?since=0&limit=10')
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [doc['id'] for doc in data['documents']] == [1, 4, 5]
+    assert [tombstone['id'] for tombstone in data['deleted']] == [102, 103, 106]
+    assert data['next_since'] == 6
+    assert data['has_more'] is False
+
+
+def test_changes_defaults_to_full_sync(client):
+    response = client.get('/api/documents/changes')
+
+    assert response.status_code == 200
+    assert len(response.get_json()['documents']) == 3
+
+
+@pytest.mark.parametrize('query', [
+    'since=abc',
+    'since=1.5',
+    'since=-1',
+    'limit=0',
+    'limit=abc',
+    'since=99',  # ahead of the latest change token
+])
+def test_changes_rejects_invalid_query(client, query):
+    response = client.get(f'/api/documents/changes?{query}')
+
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_changes_clamps_limit(client, repository):
+    response = client.get('/api/documents/changes?limit=5000')
+
+    assert response.status_code == 200
+    assert repository.requested_limit == MAX_CHANGES_LIMIT + 1